@@ -4,7 +4,6 @@ Main CLI entry point for RenewalRadar subscription manager.
 
 import argparse
 import sys
-import os
 from . import __version__
 from renewalradar.config import COMMANDS
 
@@ -3,10 +3,7 @@ AddCommand implementation for RenewalRadar subscription manager.
 Handles adding new subscriptions from the command line.
 """
 
-import argparse
 import datetime
-from dateutil.relativedelta import relativedelta
-import sys
 
 from .base import Command
 from ..models.subscription import Subscription
@@ -227,15 +224,7 @@ class AddCommand(Command):
         if not parent_name:
             return None
 
-        # Get all subscriptions
-        subscriptions = db_manager.get_all_subscriptions()
-
-        # Find the subscription with the matching name
-        for sub in subscriptions:
-            if sub["name"].lower() == parent_name.lower():
-                return sub
-
-        return None
+        return db_manager.get_subscription_by_name(parent_name)
 
     def execute(self, args):
         """
@@ -261,8 +250,7 @@ class AddCommand(Command):
                 raise ValueError("Name cannot be empty")
 
             # Create database manager
-            db_manager = DatabaseManager()
-            try:
+            with DatabaseManager() as db_manager:
                 # Find parent subscription if linked-to argument is provided
                 parent_subscription_id = None
                 parent_subscription_name = None
@@ -307,7 +295,7 @@ class AddCommand(Command):
 
                 # Display trial information if provided
                 if trial_end_date:
-                    today = datetime.datetime.now().date()
+                    today = datetime.date.today()
                     trial_end_date_obj = parse_date(trial_end_date).date()
                     days_until_trial_end = (trial_end_date_obj - today).days
 
@@ -333,8 +321,6 @@ class AddCommand(Command):
                     print(f"  Notes: {notes}")
 
                 return 0
-            finally:
-                db_manager.close()
 
         except ValueError as e:
             # Display clear error message for validation errors
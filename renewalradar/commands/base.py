@@ -3,7 +3,6 @@ Command base class for RenewalRadar subscription manager.
 Defines the interface that all commands should implement.
 """
 
-import argparse
 from abc import ABC, abstractmethod
 
 
@@ -5,16 +5,18 @@ Handles displaying subscriptions from the command line.
 
 import datetime
 import shutil
+import sys
+from collections import defaultdict
+from operator import itemgetter
 
 from colorama import init, Fore, Style
 
 from renewalradar.commands.base import Command
 from renewalradar.database.manager import DatabaseManager
 from renewalradar.registry import register_command
-from renewalradar.utils.date_utils import days_until_renewal, parse_date
+from renewalradar.utils.date_utils import parse_date
+
 
-# Initialize colorama for cross-platform color support
-init()
 @register_command
 class ViewCommand(Command):
     """Command to view subscriptions with enhanced formatting and filtering."""
@@ -38,6 +40,14 @@ class ViewCommand(Command):
     # Days thresholds for highlighting
     DUE_SOON_THRESHOLD = 7  # Days
 
+    # Summary headings for each status filter
+    STATUS_DESCRIPTIONS = {
+        'all': 'All subscriptions',
+        'upcoming': 'Upcoming renewals',
+        'overdue': 'Overdue subscriptions',
+        'trial': 'Trial subscriptions'
+    }
+
     # Symbols for tree display
     INDENT_SYMBOL = "  ↳ "  # For tabular view
     TREE_BRANCH = "↳ "  # For dependency tree view
@@ -58,6 +68,17 @@ class ViewCommand(Command):
         # Add more currencies as needed
     }
 
+    def __init__(self):
+        """Initialize the command, disabling colors when output is not a terminal."""
+        super().__init__()
+
+        # Skip ANSI escape codes entirely when output is piped or redirected
+        if not sys.stdout.isatty():
+            self.COLORS = {key: '' for key in self.COLORS}
+
+        # Terminal width is captured once per execute() run
+        self._terminal_width = None
+
     @classmethod
     def register_arguments(cls, parser):
         """Register command-specific arguments."""
@@ -104,9 +125,16 @@ class ViewCommand(Command):
 
     def execute(self, args):
         """Execute the view command with enhanced output and filtering."""
+        # Initialize colorama only where it has work to do: translating ANSI
+        # codes for an interactive Windows console
+        if sys.platform == 'win32' and sys.stdout.isatty():
+            init()
+
+        # Query the terminal size once for this run
+        self._terminal_width = self._get_terminal_width()
+
         try:
-            db_manager = DatabaseManager()
-            try:
+            with DatabaseManager() as db_manager:
                 # Get all subscriptions first
                 subscriptions = db_manager.get_all_subscriptions()
 
@@ -173,8 +201,6 @@ class ViewCommand(Command):
                 # Display summary information (based on full filtered set, not the limited display set)
                 self._display_summary(filtered_subscriptions, status=args.status, target_currency=args.currency)
                 return 0
-            finally:
-                db_manager.close()
 
         except Exception as e:
             print(f"An error occurred: {e}")
@@ -190,29 +216,24 @@ class ViewCommand(Command):
         Returns:
             list: Enhanced subscriptions with parent-child information
         """
-        # Create a map of subscription ID to subscription
-        sub_map = {sub['id']: sub for sub in subscriptions}
-
-        # Add parent name and children list to each subscription
+        # Create a map of subscription ID to subscription, resetting children
+        # lists so a child may be linked before its parent is visited
+        sub_map = {}
         for sub in subscriptions:
-            # Initialize children list
             sub['children'] = []
+            sub_map[sub['id']] = sub
 
+        # Add parent name and populate children lists in a single pass
+        for sub in subscriptions:
             # Set parent name if subscription has a parent
-            parent_id = sub.get('parent_subscription_id')
-            if parent_id and parent_id in sub_map:
-                sub['parent_name'] = sub_map[parent_id]['name']
+            parent = sub_map.get(sub.get('parent_subscription_id'))
+            if parent is not None:
+                sub['parent_name'] = parent['name']
+                parent['children'].append(sub)
             else:
                 sub['parent_name'] = None
                 sub['parent_subscription_id'] = None  # Clear invalid parent references
 
-        # Populate children lists
-        for sub in subscriptions:
-            parent_id = sub.get('parent_subscription_id')
-            if parent_id and parent_id in sub_map:
-                parent = sub_map[parent_id]
-                parent['children'].append(sub['id'])
-
         return subscriptions
 
     def _build_tree_structure(self, subscriptions):
@@ -226,15 +247,15 @@ class ViewCommand(Command):
             dict: Tree structure with parent IDs as keys and lists of child subscriptions as values
             list: List of root subscriptions (no parent)
         """
-        # Create a map of subscription ID to subscription
-        sub_map = {sub['id']: sub for sub in subscriptions}
+        # Sort once up front; partitioning a sorted list keeps every branch in order
+        subs_sorted = sorted(subscriptions, key=lambda s: s['name'].lower())
 
         # Create a tree structure where keys are parent IDs and values are lists of child subscriptions
         tree = {}
         # Find root subscriptions (those with no parent)
         roots = []
 
-        for sub in subscriptions:
+        for sub in subs_sorted:
             parent_id = sub.get('parent_subscription_id')
 
             if parent_id is None:
@@ -242,65 +263,52 @@ class ViewCommand(Command):
                 roots.append(sub)
             else:
                 # This is a child subscription
-                if parent_id not in tree:
-                    tree[parent_id] = []
-                tree[parent_id].append(sub)
-
-        # Sort roots alphabetically by name
-        roots.sort(key=lambda s: s['name'].lower())
-
-        # Sort children in each branch alphabetically
-        for parent_id in tree:
-            tree[parent_id].sort(key=lambda s: s['name'].lower())
+                tree.setdefault(parent_id, []).append(sub)
 
         return tree, roots
 
-    def _convert_currency(self, amount, from_currency, to_currency):
+    def _get_target_rate(self, target_currency):
         """
-        Convert an amount from one currency to another using exchange rates.
+        Look up the exchange rate of the currency costs are converted to.
 
         Args:
-            amount (float): The amount to convert
-            from_currency (str): Source currency code
-            to_currency (str): Target currency code
+            target_currency (str): Target currency code
 
         Returns:
-            float: Converted amount
+            float: Rate of the target currency against USD
 
         Raises:
-            ValueError: If currency codes are not supported
+            ValueError: If the target currency is not supported
         """
-        # If currencies are the same or no target currency, no conversion needed
-        if from_currency == to_currency or not to_currency:
-            return amount
-
-        # Check if both currencies are supported
-        if from_currency not in self.EXCHANGE_RATES:
-            raise ValueError(f"Unsupported source currency: {from_currency}")
-        if to_currency not in self.EXCHANGE_RATES:
-            raise ValueError(f"Unsupported target currency: {to_currency}")
+        if target_currency not in self.EXCHANGE_RATES:
+            raise ValueError(f"Unsupported target currency: {target_currency}")
 
-        # Convert to USD first (as base currency), then to target currency
-        amount_in_usd = amount / self.EXCHANGE_RATES[from_currency]
-        return amount_in_usd * self.EXCHANGE_RATES[to_currency]
+        return self.EXCHANGE_RATES[target_currency]
 
     def _enhance_subscriptions(self, subscriptions, target_currency=None):
         """
         Enhance subscriptions with additional calculated fields.
+        The subscription dictionaries are annotated in place.
 
         Args:
             subscriptions (list): List of subscription dictionaries
             target_currency (str, optional): Currency to convert costs to
 
         Returns:
-            list: Enhanced subscription dictionaries
+            list: The input list, whose dictionaries now carry the calculated fields
         """
-        today = datetime.datetime.now().date()
-        enhanced = []
+        today = datetime.date.today()
+        threshold = self.DUE_SOON_THRESHOLD
+        indent_symbol = self.INDENT_SYMBOL
+
+        # Resolve the target rate once for the whole run rather than per subscription
+        exchange_rates = self.EXCHANGE_RATES
+        target_rate = self._get_target_rate(target_currency) if target_currency else None
 
         for sub in subscriptions:
-            # Calculate days until renewal
-            days = days_until_renewal(sub["renewal_date"])
+            # Parse the renewal date once and derive days until renewal from it
+            renewal_date_obj = parse_date(sub["renewal_date"]).date()
+            days = (renewal_date_obj - today).days
 
             # Parse trial end date if exists
             trial_end_date_obj = None
@@ -317,66 +325,76 @@ class ViewCommand(Command):
                 status = "TRIAL"
             elif days < 0:
                 status = "OVERDUE"
-            elif days <= self.DUE_SOON_THRESHOLD:
+            elif days <= threshold:
                 status = "DUE_SOON"
             else:
                 status = "NORMAL"
 
-            # Create enhanced subscription with additional fields
-            enhanced_sub = {**sub}  # Create a copy
-            enhanced_sub["days_until_renewal"] = days
-            enhanced_sub["status"] = status
-            enhanced_sub["is_in_trial"] = is_in_trial
-            enhanced_sub["days_until_trial_end"] = days_until_trial_end
+            # Add calculated fields directly to the subscription
+            sub["days_until_renewal"] = days
+            sub["status"] = status
+            sub["is_in_trial"] = is_in_trial
+            sub["days_until_trial_end"] = days_until_trial_end
 
             # Handle currency conversion
-            enhanced_sub["original_currency"] = sub["currency"]
-            enhanced_sub["original_cost"] = sub["cost"]
+            sub["original_currency"] = sub["currency"]
+            sub["original_cost"] = sub["cost"]
 
             # Convert cost if target currency is specified
             if target_currency:
-                try:
-                    enhanced_sub["converted_cost"] = self._convert_currency(
-                        sub["cost"], sub["currency"], target_currency
-                    )
-                    enhanced_sub["display_currency"] = target_currency
-                    enhanced_sub["is_converted"] = (sub["currency"] != target_currency)
-                except ValueError as e:
+                rate = exchange_rates.get(sub["currency"])
+                if rate is not None:
+                    # Convert to USD first (as base currency), then to target currency
+                    is_converted = sub["currency"] != target_currency
+                    if is_converted:
+                        sub["converted_cost"] = sub["cost"] / rate * target_rate
+                    else:
+                        sub["converted_cost"] = sub["cost"]
+                    sub["display_currency"] = target_currency
+                    sub["is_converted"] = is_converted
+                else:
                     # If conversion fails, use original currency
-                    enhanced_sub["converted_cost"] = sub["cost"]
-                    enhanced_sub["display_currency"] = sub["currency"]
-                    enhanced_sub["is_converted"] = False
-                    print(f"Warning: {e}. Using original currency for {sub['name']}.")
+                    sub["converted_cost"] = sub["cost"]
+                    sub["display_currency"] = sub["currency"]
+                    sub["is_converted"] = False
+                    print(f"Warning: Unsupported source currency: {sub['currency']}. "
+                          f"Using original currency for {sub['name']}.")
             else:
                 # Use original currency if no target specified
-                enhanced_sub["converted_cost"] = sub["cost"]
-                enhanced_sub["display_currency"] = sub["currency"]
-                enhanced_sub["is_converted"] = False
+                sub["converted_cost"] = sub["cost"]
+                sub["display_currency"] = sub["currency"]
+                sub["is_converted"] = False
+
+            # Format the cost once for width calculation and display, marking converted values
+            sub["cost_str"] = f"{sub['converted_cost']:.2f}"
+            if sub["is_converted"]:
+                sub["cost_str"] += "*"
 
             # Add parsed dates for easier handling
-            enhanced_sub["start_date_obj"] = parse_date(sub["start_date"]).date()
-            enhanced_sub["renewal_date_obj"] = parse_date(sub["renewal_date"]).date()
+            sub["start_date_obj"] = parse_date(sub["start_date"]).date()
+            sub["renewal_date_obj"] = renewal_date_obj
 
             if trial_end_date_obj:
-                enhanced_sub["trial_end_date_obj"] = trial_end_date_obj
+                sub["trial_end_date_obj"] = trial_end_date_obj
 
             # Ensure notes is a string (even if None)
-            if enhanced_sub["notes"] is None:
-                enhanced_sub["notes"] = ""
+            if sub["notes"] is None:
+                sub["notes"] = ""
+
+            # Resolve the payment method placeholder once for width calculation and display
+            sub["display_payment_method"] = sub["payment_method"] or "N/A"
 
             # Ensure trial_end_date is a string (even if None)
-            if "trial_end_date" not in enhanced_sub or enhanced_sub["trial_end_date"] is None:
-                enhanced_sub["trial_end_date"] = ""
+            if "trial_end_date" not in sub or sub["trial_end_date"] is None:
+                sub["trial_end_date"] = ""
 
             # Set display name for indented view
-            if enhanced_sub["parent_subscription_id"] is not None:
-                enhanced_sub["display_name"] = f"{self.INDENT_SYMBOL}{enhanced_sub['name']}"
+            if sub["parent_subscription_id"] is not None:
+                sub["display_name"] = f"{indent_symbol}{sub['name']}"
             else:
-                enhanced_sub["display_name"] = enhanced_sub["name"]
+                sub["display_name"] = sub["name"]
 
-            enhanced.append(enhanced_sub)
-
-        return enhanced
+        return subscriptions
 
     def _filter_by_status(self, subscriptions, status):
         """
@@ -392,19 +410,17 @@ class ViewCommand(Command):
         if status == 'all':
             return subscriptions
 
-        today = datetime.datetime.now().date()
-        thirty_days_from_now = today + datetime.timedelta(days=30)
-
+        # days_until_renewal is already computed against today in _enhance_subscriptions
         if status == 'upcoming':
             return [
                 sub for sub in subscriptions
-                if today <= sub["renewal_date_obj"] <= thirty_days_from_now
+                if 0 <= sub["days_until_renewal"] <= 30
             ]
 
         if status == 'overdue':
             return [
                 sub for sub in subscriptions
-                if sub["renewal_date_obj"] < today
+                if sub["days_until_renewal"] < 0
             ]
 
         if status == 'trial':
@@ -441,10 +457,10 @@ class ViewCommand(Command):
         # Map sort fields to their key functions
         sort_keys = {
             'name': lambda s: s["name"].lower(),
-            'cost': lambda s: s["converted_cost"],
-            'renewal_date': lambda s: s["renewal_date_obj"],
-            'billing_cycle': lambda s: s["billing_cycle"],
-            'days': lambda s: s["days_until_renewal"],
+            'cost': itemgetter("converted_cost"),
+            'renewal_date': itemgetter("renewal_date_obj"),
+            'billing_cycle': itemgetter("billing_cycle"),
+            'days': itemgetter("days_until_renewal"),
             'trial_end_date': lambda s: s.get("trial_end_date_obj") or datetime.date.max,
             'parent': lambda s: (s.get("parent_name") or "").lower()
         }
@@ -462,28 +478,28 @@ class ViewCommand(Command):
         Returns:
             list: Reorganized subscriptions for display
         """
-        # Create a map of subscription ID to subscription
-        sub_map = {sub['id']: sub for sub in subscriptions}
+        # IDs of the subscriptions being displayed (children may have been filtered out)
+        visible_ids = {sub['id'] for sub in subscriptions}
 
         # Find all root subscriptions (no parent)
         root_subs = [sub for sub in subscriptions if sub['parent_subscription_id'] is None]
 
         # Create a display list with parents followed by their children
         display_list = []
+        seen_ids = set()
         for parent in root_subs:
             # Add parent to display list
             display_list.append(parent)
+            seen_ids.add(parent['id'])
 
             # Add all children
-            for child_id in parent.get('children', []):
-                if child_id in sub_map:
-                    child = sub_map[child_id]
-                    if child in subscriptions:  # Make sure child passed any filters
-                        display_list.append(child)
+            for child in parent.get('children', []):
+                if child['id'] in visible_ids:  # Make sure child passed any filters
+                    display_list.append(child)
+                    seen_ids.add(child['id'])
 
         # Add any remaining subscriptions (in case of orphaned children due to filtering)
-        remaining = [sub for sub in subscriptions if sub not in display_list]
-        display_list.extend(remaining)
+        display_list.extend(sub for sub in subscriptions if sub['id'] not in seen_ids)
 
         return display_list
 
@@ -502,15 +518,15 @@ class ViewCommand(Command):
         # Build tree structure
         tree, roots = self._build_tree_structure(subscriptions)
 
-        # Create a map of subscription ID to subscription
-        sub_map = {sub['id']: sub for sub in subscriptions}
+        # Collect output lines and write them in one go at the end
+        lines = []
 
         # Print message regarding currency conversion if applicable
         if target_currency:
-            print(f"\nDisplaying costs in {target_currency} (converted values marked with *)")
-            print()  # Empty line for better spacing
+            lines.append(f"\nDisplaying costs in {target_currency} (converted values marked with *)")
+            lines.append("")  # Empty line for better spacing
         else:
-            print()  # Empty line for better spacing
+            lines.append("")  # Empty line for better spacing
 
         # Apply limit if specified
         display_roots = roots
@@ -518,13 +534,70 @@ class ViewCommand(Command):
         if limit is not None and limit > 0 and limit < len(roots):
             display_roots = roots[:limit]
 
-        # Print each root subscription and its children recursively
+        # Resolve colors, threshold and the branch marker once for the whole tree
+        colors = self.COLORS
+        reset = colors["RESET"]
+        threshold = self.DUE_SOON_THRESHOLD
+        branch = colors["TREE_LINE"] + self.TREE_BRANCH + reset
+
+        def format_node(subscription, level, prefix):
+            """Format a single tree node using the colors resolved above."""
+            # Get color for this subscription
+            color = colors[subscription["status"]]
+
+            # Format cost
+            cost_str = self._format_cost_for_tree(subscription)
+
+            # Format status indicators
+            status_indicators = []
+
+            if subscription["is_in_trial"]:
+                days = subscription["days_until_trial_end"]
+                trial_indicator = f"[TRIAL: {days} day{'s' if days != 1 else ''} left]"
+                status_indicators.append(colors["TRIAL"] + trial_indicator + reset)
+
+            if subscription["days_until_renewal"] < 0:
+                days = abs(subscription["days_until_renewal"])
+                overdue_indicator = f"[OVERDUE: {days} day{'s' if days != 1 else ''}]"
+                status_indicators.append(colors["OVERDUE"] + overdue_indicator + reset)
+            elif subscription["days_until_renewal"] <= threshold:
+                days = subscription["days_until_renewal"]
+                due_soon_indicator = f"[DUE SOON: {days} day{'s' if days != 1 else ''}]"
+                status_indicators.append(colors["DUE_SOON"] + due_soon_indicator + reset)
+
+            # Append any notes
+            if subscription["notes"]:
+                notes_indicator = f"[NOTE: {subscription['notes'][:30]}{'...' if len(subscription['notes']) > 30 else ''}]"
+                status_indicators.append(colors["NOTES"] + notes_indicator + reset)
+
+            # Format status string
+            status_str = " ".join(status_indicators)
+
+            # Format the current subscription with appropriate indentation
+            if level == 0:
+                # Root level (no indentation or arrow)
+                return f"{color}{subscription['name']}{reset} ({cost_str}) {status_str}"
+
+            # Child level (indented with arrow)
+            return f"{prefix}{branch}{color}{subscription['name']}{reset} ({cost_str}) {status_str}"
+
+        # Walk each root and its descendants depth-first with an explicit stack.
+        # Children are pushed in reverse so they pop in alphabetical order.
         for root in display_roots:
-            self._print_tree_node(root, tree, sub_map, target_currency)
+            stack = [(root, 0, "")]
+            while stack:
+                subscription, level, prefix = stack.pop()
+                lines.append(format_node(subscription, level, prefix))
+
+                child_prefix = prefix + "  "
+                for child in reversed(tree.get(subscription["id"], ())):
+                    stack.append((child, level + 1, child_prefix))
 
         # Show limit message if applicable
         if limit is not None and limit > 0 and limit < total_count:
-            print(f"\nShowing first {len(display_roots)} of {total_count} root subscriptions.")
+            lines.append(f"\nShowing first {len(display_roots)} of {total_count} root subscriptions.")
+
+        sys.stdout.write("\n".join(lines) + "\n")
 
     def _format_cost_for_tree(self, sub, target_currency=None):
         """
@@ -550,68 +623,6 @@ class ViewCommand(Command):
 
         return cost_str
 
-    def _print_tree_node(self, subscription, tree, sub_map, target_currency=None, level=0, prefix=""):
-        """
-        Print a node in the dependency tree and its children recursively.
-
-        Args:
-            subscription (dict): Current subscription dictionary
-            tree (dict): Tree structure of parent ID to list of child subscriptions
-            sub_map (dict): Map of subscription ID to subscription
-            target_currency (str, optional): Currency to display costs in
-            level (int): Current nesting level (0 for roots)
-            prefix (str): Prefix string for indentation
-        """
-        # Get color for this subscription
-        color = self.COLORS[subscription["status"]]
-
-        # Format cost
-        cost_str = self._format_cost_for_tree(subscription, target_currency)
-
-        # Format status indicators
-        status_indicators = []
-
-        if subscription["is_in_trial"]:
-            days = subscription["days_until_trial_end"]
-            trial_indicator = f"[TRIAL: {days} day{'s' if days != 1 else ''} left]"
-            status_indicators.append(self.COLORS["TRIAL"] + trial_indicator + self.COLORS["RESET"])
-
-        if subscription["days_until_renewal"] < 0:
-            days = abs(subscription["days_until_renewal"])
-            overdue_indicator = f"[OVERDUE: {days} day{'s' if days != 1 else ''}]"
-            status_indicators.append(self.COLORS["OVERDUE"] + overdue_indicator + self.COLORS["RESET"])
-        elif subscription["days_until_renewal"] <= self.DUE_SOON_THRESHOLD:
-            days = subscription["days_until_renewal"]
-            due_soon_indicator = f"[DUE SOON: {days} day{'s' if days != 1 else ''}]"
-            status_indicators.append(self.COLORS["DUE_SOON"] + due_soon_indicator + self.COLORS["RESET"])
-
-        # Append any notes
-        if subscription["notes"]:
-            notes_indicator = f"[NOTE: {subscription['notes'][:30]}{'...' if len(subscription['notes']) > 30 else ''}]"
-            status_indicators.append(self.COLORS["NOTES"] + notes_indicator + self.COLORS["RESET"])
-
-        # Format status string
-        status_str = " ".join(status_indicators)
-
-        # Print the current subscription with appropriate indentation
-        if level == 0:
-            # Root level (no indentation or arrow)
-            print(f"{color}{subscription['name']}{self.COLORS['RESET']} ({cost_str}) {status_str}")
-        else:
-            # Child level (indented with arrow)
-            branch = self.COLORS["TREE_LINE"] + self.TREE_BRANCH + self.COLORS["RESET"]
-            print(f"{prefix}{branch}{color}{subscription['name']}{self.COLORS['RESET']} ({cost_str}) {status_str}")
-
-        # Find children of this subscription
-        subscription_id = subscription["id"]
-        if subscription_id in tree and tree[subscription_id]:
-            # Calculate new prefix for children
-            new_prefix = prefix + "  "
-
-            # Print all children recursively
-            for child in tree[subscription_id]:
-                self._print_tree_node(child, tree, sub_map, target_currency, level + 1, new_prefix)
-
     def _get_terminal_width(self):
         """
         Get the terminal width for display formatting.
@@ -649,8 +660,8 @@ class ViewCommand(Command):
         Returns:
             dict: Column width configuration
         """
-        # Get terminal width
-        terminal_width = self._get_terminal_width()
+        # Get terminal width (cached by execute, queried here otherwise)
+        terminal_width = self._terminal_width or self._get_terminal_width()
 
         # Define minimum column widths
         min_widths = {
@@ -667,30 +678,60 @@ class ViewCommand(Command):
             "notes": 8
         }
 
-        # Calculate max content lengths
+        # Calculate max content lengths in a single pass over the subscriptions
         # For name, consider indentation in hierarchical view
         name_field = "display_name" if not flat_view else "name"
-        max_name_width = max([len(s[name_field]) for s in subscriptions])
-
-        # For cost, consider the conversion format
-        max_cost_width = max([
-            len(f"{s['converted_cost']:.2f}") +
-            (3 if s['is_converted'] else 0)  # Add space for * if converted
-            for s in subscriptions
-        ])
+        name_w = min_widths["name"]
+        cost_w = min_widths["cost"]
+        currency_w = min_widths["currency"]
+        cycle_w = min_widths["cycle"]
+        parent_w = min_widths["parent"]
+        payment_w = min_widths["payment"]
+        notes_w = 0
+
+        for s in subscriptions:
+            n = len(s[name_field])
+            if n > name_w:
+                name_w = n
+
+            # For cost, consider the conversion format
+            # cost_str already ends in "*" when converted; keep two extra columns of padding
+            n = len(s["cost_str"]) + (2 if s["is_converted"] else 0)
+            if n > cost_w:
+                cost_w = n
+
+            n = len(s["display_currency"])
+            if n > currency_w:
+                currency_w = n
+
+            n = len(s["billing_cycle"])
+            if n > cycle_w:
+                cycle_w = n
+
+            n = len(s.get("parent_name") or "—")
+            if n > parent_w:
+                parent_w = n
+
+            n = len(s["display_payment_method"])
+            if n > payment_w:
+                payment_w = n
+
+            n = len(s["notes"])
+            if n > notes_w:
+                notes_w = n
 
         max_widths = {
-            "name": max(min_widths["name"], max_name_width),
-            "cost": max(min_widths["cost"], max_cost_width),
-            "currency": max(min_widths["currency"], max([len(s["display_currency"]) for s in subscriptions])),
-            "cycle": max(min_widths["cycle"], max([len(s["billing_cycle"]) for s in subscriptions])),
+            "name": name_w,
+            "cost": cost_w,
+            "currency": currency_w,
+            "cycle": cycle_w,
             "start_date": min_widths["start_date"],  # Fixed width for dates
             "renewal_date": min_widths["renewal_date"],  # Fixed width for dates
             "trial_end": min_widths["trial_end"],  # Fixed width for dates
-            "parent": max(min_widths["parent"], max([len(s.get("parent_name") or "—") for s in subscriptions])),
-            "payment": max(min_widths["payment"], max([len(s["payment_method"] or "N/A") for s in subscriptions])),
+            "parent": parent_w,
+            "payment": payment_w,
             "days": min_widths["days"],  # Fixed width for days
-            "notes": max(min_widths["notes"], min(15, max([len(s["notes"]) for s in subscriptions])))  # Cap at 15 chars
+            "notes": max(min_widths["notes"], min(15, notes_w))  # Cap at 15 chars
         }
 
         # Calculate total width needed
@@ -730,30 +771,6 @@ class ViewCommand(Command):
 
         return max_widths
 
-    def _format_cost(self, subscription, width):
-        """
-        Format a cost value for display, handling currency conversion.
-
-        Args:
-            subscription (dict): Enhanced subscription with cost info
-            width (int): Column width to fit
-
-        Returns:
-            str: Formatted cost string
-        """
-        cost = subscription["converted_cost"]
-        currency = subscription["display_currency"]
-        is_converted = subscription.get("is_converted", False)
-
-        # Format the cost with 2 decimal places
-        cost_str = f"{cost:.2f}"
-
-        # Add an asterisk if the cost was converted
-        if is_converted:
-            cost_str = f"{cost_str}*"
-
-        return cost_str
-
     def _display_subscriptions(self, subscriptions, target_currency=None, flat_view=False):
         """
         Display subscriptions in a nicely formatted table with color highlighting.
@@ -783,50 +800,75 @@ class ViewCommand(Command):
             f"{'DAYS':<{widths['days']}} "
             f"{'NOTES':<{widths['notes']}}{self.COLORS['RESET']}"
         )
-        print("\n" + header)
-        print("-" * len(header.replace(self.COLORS['HEADER'], '').replace(self.COLORS['RESET'], '')))
+        # Separator spans every column plus the single space between columns
+        separator_length = sum(widths.values()) + len(widths) - 1
+        lines = ["", header, "-" * separator_length]
 
         # Print message regarding currency conversion if applicable
         if target_currency:
-            print(f"Displaying costs in {target_currency} (converted values marked with *)")
+            lines.append(f"Displaying costs in {target_currency} (converted values marked with *)")
+
+        # Bind loop invariants to locals once instead of per row
+        colors = self.COLORS
+        reset = colors['RESET']
+        parent_color = colors['PARENT']
+        notes_color = colors['NOTES']
+
+        # Use display_name for hierarchical view, regular name for flat view
+        name_field = "display_name" if not flat_view else "name"
+
+        # Substitute the column widths into the row template once per render
+        row_template = (
+            "{color}{name:<%d} {cost:<%d} {currency:<%d} {cycle:<%d} "
+            "{start:<%d} {renewal:<%d} {trial_end:<%d} "
+            "{parent_color}{parent:<%d}{parent_reset} {payment:<%d} {days:<%d} "
+            "{notes_color}{notes}{reset}"
+        ) % (
+            widths['name'], widths['cost'], widths['currency'], widths['cycle'],
+            widths['start_date'], widths['renewal_date'], widths['trial_end'],
+            widths['parent'], widths['payment'], widths['days']
+        )
 
-        # Print each subscription
+        # Format each subscription
         for sub in subscriptions:
             # Get the appropriate color based on status
-            color = self.COLORS[sub["status"]]
+            color = colors[sub["status"]]
 
             # Get days string with sign for overdue
-            days = sub["days_until_renewal"]
-            if days < 0:
-                days_str = f"{days}"  # Negative number for overdue
-            else:
-                days_str = f"{days}"
+            days_str = str(sub["days_until_renewal"])
 
             # Format each field with truncation if needed
-            # Use display_name for hierarchical view, regular name for flat view
-            name_field = "display_name" if not flat_view else "name"
             name = self._truncate_text(sub[name_field], widths['name'])
-            payment = self._truncate_text(sub['payment_method'] or 'N/A', widths['payment'])
+            payment = self._truncate_text(sub['display_payment_method'], widths['payment'])
             notes = self._truncate_text(sub['notes'] or '-', widths['notes'])
             trial_end = sub['trial_end_date'] or "—"  # Display dash if no trial end date
-            cost_str = self._format_cost(sub, widths['cost'])
+            cost_str = sub['cost_str']  # Pre-formatted, with "*" if converted
             parent = sub.get('parent_name') or "—"  # Display dash if no parent
 
-            # Print the formatted row with color
-            row = (
-                f"{color}{name:<{widths['name']}} "
-                f"{cost_str:<{widths['cost']}} "
-                f"{sub['display_currency']:<{widths['currency']}} "
-                f"{sub['billing_cycle']:<{widths['cycle']}} "
-                f"{sub['start_date']:<{widths['start_date']}} "
-                f"{sub['renewal_date']:<{widths['renewal_date']}} "
-                f"{trial_end:<{widths['trial_end']}} "
-                f"{self.COLORS['PARENT'] if parent != '—' else ''}{parent:<{widths['parent']}}{self.COLORS['RESET'] if parent != '—' else ''} "
-                f"{payment:<{widths['payment']}} "
-                f"{days_str:<{widths['days']}} "
-                f"{self.COLORS['NOTES']}{notes}{self.COLORS['RESET']}"
+            # Build the formatted row with color
+            has_parent = parent != '—'
+            row = row_template.format(
+                color=color,
+                name=name,
+                cost=cost_str,
+                currency=sub['display_currency'],
+                cycle=sub['billing_cycle'],
+                start=sub['start_date'],
+                renewal=sub['renewal_date'],
+                trial_end=trial_end,
+                parent_color=parent_color if has_parent else '',
+                parent=parent,
+                parent_reset=reset if has_parent else '',
+                payment=payment,
+                days=days_str,
+                notes_color=notes_color,
+                notes=notes,
+                reset=reset
             )
-            print(row)
+            lines.append(row)
+
+        # Emit the whole table with a single write
+        sys.stdout.write("\n".join(lines) + "\n")
 
     def _display_summary(self, subscriptions, status='all', target_currency=None):
         """
@@ -840,125 +882,129 @@ class ViewCommand(Command):
         # Count subscriptions
         total_count = len(subscriptions)
 
-        # Count parent and child subscriptions
-        parent_count = sum(1 for sub in subscriptions if sub['parent_subscription_id'] is None)
-        child_count = sum(1 for sub in subscriptions if sub['parent_subscription_id'] is not None)
+        # Calculate cost totals, counts and the renewal/trial windows in one pass
+        monthly_totals = defaultdict(float)
+        yearly_totals = defaultdict(float)
+        parent_count = 0
+        child_count = 0
+        overdue_count = 0
+        due_soon_count = 0
+        trial_count = 0
+        with_notes_count = 0
+        upcoming_renewals = []
+        upcoming_trial_ends = []
+        threshold = self.DUE_SOON_THRESHOLD
 
-        # Calculate total monthly and yearly costs
-        if target_currency:
-            # When a target currency is specified, use the converted costs
-            monthly_totals = {target_currency: 0}
-            yearly_totals = {target_currency: 0}
+        for sub in subscriptions:
+            # Count parent and child subscriptions
+            if sub['parent_subscription_id'] is None:
+                parent_count += 1
+            else:
+                child_count += 1
 
-            for sub in subscriptions:
+            if target_currency:
+                # When a target currency is specified, use the converted costs
                 cost = sub["converted_cost"]  # Already converted
-
-                if sub["billing_cycle"] == "monthly":
-                    monthly_totals[target_currency] += cost
-                    yearly_totals[target_currency] += cost * 12
-                elif sub["billing_cycle"] == "yearly":
-                    monthly_totals[target_currency] += cost / 12
-                    yearly_totals[target_currency] += cost
-        else:
-            # Original behavior: group by original currency
-            monthly_totals = {}
-            yearly_totals = {}
-
-            for sub in subscriptions:
+                currency = target_currency
+            else:
+                # Original behavior: group by original currency
                 cost = sub["original_cost"]
                 currency = sub["original_currency"]
 
-                # Initialize totals for this currency if not exist
-                if currency not in monthly_totals:
-                    monthly_totals[currency] = 0
-                    yearly_totals[currency] = 0
+            if sub["billing_cycle"] == "monthly":
+                monthly_totals[currency] += cost
+                yearly_totals[currency] += cost * 12
+            elif sub["billing_cycle"] == "yearly":
+                monthly_totals[currency] += cost / 12
+                yearly_totals[currency] += cost
+
+            # Count status breakdown
+            days = sub["days_until_renewal"]
+            if days < 0:
+                overdue_count += 1
+            elif days <= threshold:
+                due_soon_count += 1
+
+            # Collect renewals within +/- 30 days
+            if -30 <= days <= 30:
+                upcoming_renewals.append((sub["name"], sub["renewal_date"], days, sub["is_in_trial"]))
 
-                if sub["billing_cycle"] == "monthly":
-                    monthly_totals[currency] += cost
-                    yearly_totals[currency] += cost * 12
-                elif sub["billing_cycle"] == "yearly":
-                    monthly_totals[currency] += cost / 12
-                    yearly_totals[currency] += cost
+            # Count active trials
+            if sub["is_in_trial"]:
+                trial_count += 1
 
-        # Count status breakdown
-        overdue_count = sum(1 for sub in subscriptions if sub["days_until_renewal"] < 0)
-        due_soon_count = sum(1 for sub in subscriptions if 0 <= sub["days_until_renewal"] <= self.DUE_SOON_THRESHOLD)
-        trial_count = sum(1 for sub in subscriptions if sub["is_in_trial"])
+            # Collect trials ending within the last 7 or next 30 days
+            if sub["trial_end_date"] and -7 <= sub["days_until_trial_end"] <= 30:
+                upcoming_trial_ends.append((sub["name"], sub["trial_end_date"], sub["days_until_trial_end"]))
 
-        # Count subscriptions with notes
-        with_notes_count = sum(1 for sub in subscriptions if sub["notes"])
+            # Count subscriptions with notes
+            if sub["notes"]:
+                with_notes_count += 1
 
         # Print summary
-        status_desc = {
-            'all': 'All subscriptions',
-            'upcoming': 'Upcoming renewals',
-            'overdue': 'Overdue subscriptions',
-            'trial': 'Trial subscriptions'
-        }
+        # Bind colors to locals for the formatting below
+        colors = self.COLORS
+        reset = colors['RESET']
 
-        print(f"\n{self.COLORS['HEADER']}SUMMARY: {status_desc.get(status, 'Subscriptions')}{self.COLORS['RESET']}")
-        print(f"Total subscriptions: {total_count}")
-        print(f"{self.COLORS['PARENT']}Parent subscriptions: {parent_count}{self.COLORS['RESET']}")
-        print(f"{self.COLORS['PARENT']}Child subscriptions: {child_count}{self.COLORS['RESET']}")
+        lines = []
+        lines.append(f"\n{colors['HEADER']}SUMMARY: {self.STATUS_DESCRIPTIONS.get(status, 'Subscriptions')}{reset}")
+        lines.append(f"Total subscriptions: {total_count}")
+        lines.append(f"{colors['PARENT']}Parent subscriptions: {parent_count}{reset}")
+        lines.append(f"{colors['PARENT']}Child subscriptions: {child_count}{reset}")
 
         # Show status breakdown only if showing all subscriptions
         if status == 'all':
-            print(f"{self.COLORS['OVERDUE']}Overdue: {overdue_count}{self.COLORS['RESET']}")
-            print(
-                f"{self.COLORS['DUE_SOON']}Due within {self.DUE_SOON_THRESHOLD} days: {due_soon_count}{self.COLORS['RESET']}")
-            print(f"{self.COLORS['TRIAL']}In trial period: {trial_count}{self.COLORS['RESET']}")
+            lines.append(f"{colors['OVERDUE']}Overdue: {overdue_count}{reset}")
+            lines.append(
+                f"{colors['DUE_SOON']}Due within {threshold} days: {due_soon_count}{reset}")
+            lines.append(f"{colors['TRIAL']}In trial period: {trial_count}{reset}")
 
         # Show count of subscriptions with notes
-        print(f"{self.COLORS['NOTES']}With notes: {with_notes_count}{self.COLORS['RESET']}")
+        lines.append(f"{colors['NOTES']}With notes: {with_notes_count}{reset}")
 
         # Show cost totals
         # If a target currency is used, indicate that values are converted
         conversion_note = " (converted)" if target_currency else ""
 
-        print(f"\nMonthly costs{conversion_note}:")
+        lines.append(f"\nMonthly costs{conversion_note}:")
         for currency, total in monthly_totals.items():
-            print(f"  {currency}: {total:.2f}")
+            lines.append(f"  {currency}: {total:.2f}")
 
-        print(f"\nYearly costs{conversion_note}:")
+        lines.append(f"\nYearly costs{conversion_note}:")
         for currency, total in yearly_totals.items():
-            print(f"  {currency}: {total:.2f}")
+            lines.append(f"  {currency}: {total:.2f}")
 
         # Show upcoming trials ending if there are any
-        upcoming_trial_ends = [
-            (sub["name"], sub["trial_end_date"], sub["days_until_trial_end"])
-            for sub in subscriptions
-            if sub["trial_end_date"] and -7 <= sub["days_until_trial_end"] <= 30
-        ]
-
         if upcoming_trial_ends and (status == 'all' or status == 'trial'):
-            print(f"\n{self.COLORS['TRIAL']}Trial end dates (next 30 days):{self.COLORS['RESET']}")
-            for name, date, days in sorted(upcoming_trial_ends, key=lambda x: x[2]):
+            lines.append(f"\n{colors['TRIAL']}Trial end dates (next 30 days):{reset}")
+            for name, date, days in sorted(upcoming_trial_ends, key=itemgetter(2)):
                 if days < 0:
-                    print(f"  {self.COLORS['TRIAL']}{name}: {date} (ended {abs(days)} days ago){self.COLORS['RESET']}")
+                    lines.append(f"  {colors['TRIAL']}{name}: {date} (ended {abs(days)} days ago){reset}")
                 elif days == 0:
-                    print(f"  {self.COLORS['TRIAL']}{name}: {date} (ends today){self.COLORS['RESET']}")
+                    lines.append(f"  {colors['TRIAL']}{name}: {date} (ends today){reset}")
                 else:
-                    print(f"  {self.COLORS['TRIAL']}{name}: {date} (ends in {days} days){self.COLORS['RESET']}")
+                    lines.append(f"  {colors['TRIAL']}{name}: {date} (ends in {days} days){reset}")
 
         # Show most imminent renewals if there are any
-        upcoming_renewals = [
-            (sub["name"], sub["renewal_date"], sub["days_until_renewal"], sub["is_in_trial"])
-            for sub in subscriptions
-            if -30 <= sub["days_until_renewal"] <= 30  # Show renewals within +/- 30 days
-        ]
-
         if upcoming_renewals:
-            print("\nRecent & upcoming renewals (±30 days):")
-            for name, date, days, is_trial in sorted(upcoming_renewals, key=lambda x: x[2]):
-                color = self.COLORS['TRIAL'] if is_trial else (
-                    self.COLORS['OVERDUE'] if days < 0 else
-                    self.COLORS['DUE_SOON'] if days <= self.DUE_SOON_THRESHOLD else
-                    self.COLORS['NORMAL']
+            lines.append("\nRecent & upcoming renewals (±30 days):")
+            trial_color = colors['TRIAL']
+            overdue_color = colors['OVERDUE']
+            due_soon_color = colors['DUE_SOON']
+            normal_color = colors['NORMAL']
+            for name, date, days, is_trial in sorted(upcoming_renewals, key=itemgetter(2)):
+                color = trial_color if is_trial else (
+                    overdue_color if days < 0 else
+                    due_soon_color if days <= threshold else
+                    normal_color
                 )
 
                 if days < 0:
-                    print(f"  {color}{name}: {date} ({days} days ago - OVERDUE){self.COLORS['RESET']}")
+                    lines.append(f"  {color}{name}: {date} ({days} days ago - OVERDUE){reset}")
                 elif days == 0:
-                    print(f"  {color}{name}: {date} (today){self.COLORS['RESET']}")
+                    lines.append(f"  {color}{name}: {date} (today){reset}")
                 else:
-                    print(f"  {color}{name}: {date} (in {days} days){self.COLORS['RESET']}")
\ No newline at end of file
+                    lines.append(f"  {color}{name}: {date} (in {days} days){reset}")
+
+        # Emit the whole summary with a single write
+        sys.stdout.write("\n".join(lines) + "\n")
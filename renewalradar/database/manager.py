@@ -5,8 +5,7 @@ Provides connection management and database operations.
 
 import sqlite3
 import datetime
-from pathlib import Path
-from .schema import get_db_path, initialize_db
+from .schema import initialize_db
 
 
 class DatabaseManager:
@@ -31,6 +30,10 @@ class DatabaseManager:
             # Enable foreign key constraints
             self.cursor.execute("PRAGMA foreign_keys = ON")
 
+            # Expose Python's str.lower to SQL; SQLite's lower() and NOCASE
+            # only fold ASCII letters
+            self.conn.create_function("py_lower", 1, str.lower, deterministic=True)
+
         return self.conn, self.cursor
 
     def close(self):
@@ -40,6 +43,15 @@ class DatabaseManager:
             self.conn = None
             self.cursor = None
 
+    def __enter__(self):
+        """Use the manager as a context manager that closes on exit."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Close the database connection when leaving the context."""
+        self.close()
+        return False
+
     def add_subscription(self, subscription_data):
         """
         Add a new subscription to the database.
@@ -137,6 +149,29 @@ class DatabaseManager:
             return {key: row[key] for key in row.keys()}
         return None
 
+    def get_subscription_by_name(self, name):
+        """
+        Retrieve a subscription by name (case-insensitive, using str.lower).
+
+        Args:
+            name (str): The name of the subscription to retrieve
+
+        Returns:
+            dict or None: The first matching subscription or None if not found
+        """
+        conn, cursor = self.connect()
+
+        cursor.execute(
+            "SELECT * FROM subscriptions WHERE py_lower(name) = ? "
+            "ORDER BY id LIMIT 1",
+            (name.lower(),)
+        )
+        row = cursor.fetchone()
+
+        if row:
+            return {key: row[key] for key in row.keys()}
+        return None
+
     def update_subscription(self, subscription_id, data):
         """
         Update an existing subscription.
@@ -5,8 +5,6 @@ Defines the SQLite tables and their structure.
 
 import sqlite3
 from pathlib import Path
-import os
-import datetime
 
 # Schema version
 SCHEMA_VERSION = 1
@@ -53,6 +51,13 @@ def initialize_db():
     )
     ''')
 
+    # Index the parent reference so child lookups (including the foreign key
+    # check SQLite runs when a parent is deleted) avoid a full table scan
+    cursor.execute('''
+    CREATE INDEX IF NOT EXISTS idx_subscriptions_parent
+    ON subscriptions(parent_subscription_id)
+    ''')
+
     # Create metadata table for schema version tracking
     cursor.execute('''
     CREATE TABLE IF NOT EXISTS metadata (
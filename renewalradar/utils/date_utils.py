@@ -4,14 +4,17 @@ Handles date parsing, validation, and calculations.
 """
 
 import datetime
+from functools import lru_cache
 from dateutil.relativedelta import relativedelta
 import re
 
 
+@lru_cache(maxsize=4096)
 def parse_date(date_str):
     """
     Parse a date string into a datetime object.
     Supports ISO format (YYYY-MM-DD) and other common formats.
+    Results are cached, since the same date strings recur across rows.
 
     Args:
         date_str (str): Date string to parse